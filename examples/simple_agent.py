@@ -3,7 +3,7 @@ Simple LangChain Agent Example
 
 Demonstrates using Thordata tools with a LangChain agent to:
 1. Search for information
-2. Scrape a webpage
+2. Scrape the top search results concurrently and pick the best page
 3. Summarize the content
 
 Requirements:
@@ -14,11 +14,14 @@ Usage:
     python examples/simple_agent.py
 """
 
+import asyncio
 import os
 import sys
-from dotenv import load_dotenv
+from typing import List, Tuple
 
-load_dotenv()
+from thordata_langchain_tools import ensure_dotenv
+
+ensure_dotenv()
 
 # Check required environment variables
 if not os.getenv("THORDATA_SCRAPER_TOKEN"):
@@ -30,72 +33,128 @@ if not os.getenv("OPENAI_API_KEY"):
     sys.exit(1)
 
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage
+from langchain_core.prompts import ChatPromptTemplate
+
+from thordata_langchain_tools import (
+    ThordataSerpTool,
+    ThordataScrapeTool,
+    ThordataToolError,
+    close_async_client,
+)
+
+# Number of top search results to scrape speculatively in parallel
+NUM_CANDIDATES = 3
+
+# Maximum number of scrapes in flight at once
+MAX_CONCURRENT_SCRAPES = 5
+
+# Substring identifying the preferred result link
+HOMEPAGE_HINT = "thordata"
 
-from thordata_langchain_tools import ThordataSerpTool, ThordataScrapeTool
+# Maximum characters of HTML sent to the LLM
+MAX_HTML_FOR_LLM = 4000
 
+SUMMARY_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "human",
+            """You are a helpful assistant that summarizes web content.
 
-def search_for_homepage(query: str) -> str:
-    """Use SERP tool to find a homepage URL."""
+Based on the following HTML content, provide a brief summary about {topic}.
+Focus on the key products, services, or features mentioned.
+
+Provide your summary in 3-5 bullet points.
+
+HTML Content:
+{html}
+""",
+        )
+    ]
+)
+
+# Built once so every summary reuses the same client and HTTP pool
+SUMMARY_CHAIN = SUMMARY_PROMPT | ChatOpenAI(model="gpt-4o-mini", temperature=0)
+
+
+async def search_candidates(query: str) -> List[str]:
+    """Use SERP tool to find candidate homepage URLs."""
     print(f"🔍 Searching for: '{query}'")
 
     serp_tool = ThordataSerpTool()
-    results = serp_tool.invoke(
+    results = await serp_tool.ainvoke(
         {
             "query": query,
             "engine": "google",
-            "num": 3,
+            "num": NUM_CANDIDATES,
         }
     )
 
-    organic = results.get("organic", [])
-    for item in organic:
-        link = item.get("link", "")
-        if link and "thordata" in link.lower():
-            return link
+    if "error" in results:
+        raise RuntimeError(results["error"])
 
-    # Return first result if no thordata link found
-    if organic:
-        return organic[0].get("link", "")
+    organic = results.get("organic", ())
+    links = [link for item in organic if (link := item.get("link"))][:NUM_CANDIDATES]
+    if not links:
+        raise RuntimeError("No results found")
 
-    raise RuntimeError("No results found")
+    return links
 
 
-def scrape_page(url: str) -> str:
+async def scrape_page(url: str, semaphore: asyncio.Semaphore) -> str:
     """Use Scrape tool to get page content."""
-    print(f"📄 Scraping: {url}")
-
-    scrape_tool = ThordataScrapeTool()
-    html = scrape_tool.invoke(
-        {
-            "url": url,
-            "js_render": False,
-            "max_length": 5000,
-        }
+    async with semaphore:
+        print(f"📄 Scraping: {url}")
+
+        scrape_tool = ThordataScrapeTool()
+        return await scrape_tool.ainvoke(
+            {
+                "url": url,
+                "js_render": False,
+                "max_length": 5000,
+            }
+        )
+
+
+def pick_homepage(pages: List[Tuple[str, str]]) -> Tuple[str, str]:
+    """Prefer a scraped thordata link, otherwise the first successful scrape."""
+    scraped = [
+        (url, html) for url, html in pages if not isinstance(html, ThordataToolError)
+    ]
+    if not scraped:
+        raise RuntimeError("Could not scrape any search result")
+
+    return next(
+        ((url, html) for url, html in scraped if HOMEPAGE_HINT in url.lower()),
+        scraped[0],
     )
 
-    return html
 
-
-def summarize_with_llm(html: str, topic: str) -> str:
+async def summarize_with_llm(html: str, topic: str) -> str:
     """Use LLM to summarize the content."""
     print("🤖 Summarizing with LLM...")
 
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    response = await SUMMARY_CHAIN.ainvoke(
+        {"topic": topic, "html": html[:MAX_HTML_FOR_LLM]}
+    )
+    return response.content
 
-    prompt = f"""You are a helpful assistant that summarizes web content.
 
-Based on the following HTML content, provide a brief summary about {topic}.
-Focus on the key products, services, or features mentioned.
+async def main_async() -> str:
+    try:
+        # Step 1: Search for Thordata
+        urls = await search_candidates("Thordata proxy network official site")
+        print(f"   Found {len(urls)} candidate URLs\n")
 
-Provide your summary in 3-5 bullet points.
+        # Step 2: Scrape every candidate in parallel, then pick the best
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
+        htmls = await asyncio.gather(*(scrape_page(url, semaphore) for url in urls))
+        url, html = pick_homepage(list(zip(urls, htmls)))
+        print(f"   Using {url} ({len(html)} characters)\n")
 
-HTML Content:
-{html[:4000]}
-"""
-
-    response = llm.invoke([HumanMessage(content=prompt)])
-    return response.content
+        # Step 3: Summarize
+        return await summarize_with_llm(html, "Thordata's services")
+    finally:
+        await close_async_client()
 
 
 def main():
@@ -105,16 +164,7 @@ def main():
     print()
 
     try:
-        # Step 1: Search for Thordata
-        url = search_for_homepage("Thordata proxy network official site")
-        print(f"   Found URL: {url}\n")
-
-        # Step 2: Scrape the page
-        html = scrape_page(url)
-        print(f"   Scraped {len(html)} characters\n")
-
-        # Step 3: Summarize
-        summary = summarize_with_llm(html, "Thordata's services")
+        summary = asyncio.run(main_async())
 
         print()
         print("=" * 60)
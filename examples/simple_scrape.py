@@ -9,15 +9,15 @@ Usage:
 
 import os
 import sys
-from dotenv import load_dotenv
+from thordata_langchain_tools import ensure_dotenv
 
-load_dotenv()
+ensure_dotenv()
 
 if not os.getenv("THORDATA_SCRAPER_TOKEN"):
     print("❌ Error: Set THORDATA_SCRAPER_TOKEN in your .env file")
     sys.exit(1)
 
-from thordata_langchain_tools import ThordataScrapeTool
+from thordata_langchain_tools import ThordataScrapeTool, ThordataToolError
 
 
 def main():
@@ -36,7 +36,7 @@ def main():
         }
     )
 
-    if html.startswith("Error"):
+    if isinstance(html, ThordataToolError):
         print(f"❌ {html}")
         return
 
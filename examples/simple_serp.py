@@ -9,10 +9,10 @@ Usage:
 
 import os
 import sys
-from dotenv import load_dotenv
+from thordata_langchain_tools import ensure_dotenv
 
 # Load environment variables
-load_dotenv()
+ensure_dotenv()
 
 # Check for required token
 if not os.getenv("THORDATA_SCRAPER_TOKEN"):
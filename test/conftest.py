@@ -2,7 +2,15 @@
 Pytest configuration for thordata-langchain-tools tests.
 """
 
+import types
+
 import pytest
+import requests
+
+from thordata_langchain_tools._cache import get_cache
+from thordata_langchain_tools._client import _get_shared_client
+from thordata_langchain_tools._env import get_env
+from thordata_langchain_tools._ratelimit import BACKOFF, host_backoff
 
 
 @pytest.fixture(autouse=True)
@@ -13,3 +21,90 @@ def mock_env_vars(monkeypatch):
     monkeypatch.setenv("THORDATA_PUBLIC_KEY", "test_public_key")
     monkeypatch.setenv("THORDATA_USERNAME", "test_user")
     monkeypatch.setenv("THORDATA_PASSWORD", "test_pass")
+    get_env.cache_clear()
+    yield
+    get_env.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Start every test with a fresh response cache."""
+    get_cache.cache_clear()
+    yield
+    get_cache.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_client():
+    """Build a fresh shared client for every test."""
+    _get_shared_client.cache_clear()
+    yield
+    _get_shared_client.cache_clear()
+
+
+def _fake_response(content=b"{}", text="", status_code=200, headers=None):
+    """Build a minimal stand-in for ``requests.Response``."""
+    return types.SimpleNamespace(
+        status_code=status_code,
+        headers=headers or {},
+        content=content,
+        text=text,
+        raise_for_status=lambda: None,
+    )
+
+
+@pytest.fixture
+def make_response():
+    """Factory for fake ``requests.Response`` objects."""
+    return _fake_response
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    """Replace the sync Thordata client with a lightweight fake."""
+    client = types.SimpleNamespace(
+        serp_search=lambda query, **kwargs: {"organic": []},
+        universal_scrape=lambda url, **kwargs: "<html></html>",
+        get=lambda url, **kwargs: _fake_response(),
+        _http=types.SimpleNamespace(_session=requests.Session()),
+    )
+    monkeypatch.setattr(
+        "thordata_langchain_tools._client.ThordataClient", lambda **kwargs: client
+    )
+    return client
+
+
+@pytest.fixture
+def fake_async_client(monkeypatch):
+    """Replace the async Thordata client with a lightweight fake."""
+
+    async def serp_search(query, **kwargs):
+        return {"organic": []}
+
+    async def universal_scrape(url, **kwargs):
+        return "<html></html>"
+
+    async def close():
+        client.closed += 1
+
+    client = types.SimpleNamespace(
+        serp_search=serp_search,
+        universal_scrape=universal_scrape,
+        close=close,
+        closed=0,
+    )
+    monkeypatch.setattr(
+        "thordata_langchain_tools._client.AsyncThordataClient",
+        lambda **kwargs: client,
+    )
+    return client
+
+
+@pytest.fixture(autouse=True)
+def reset_backoff():
+    """Start every test without a pending rate-limit backoff."""
+    BACKOFF.reset()
+    host_backoff.cache_clear()
+    yield
+    BACKOFF.reset()
+    host_backoff.cache_clear()
@@ -2,14 +2,48 @@
 Tests for Thordata LangChain tools.
 """
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import copy
+import gc
+import pickle
+import threading
+import time
+import types
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import ValidationError
+from thordata import ThordataRateLimitError
 
 from thordata_langchain_tools import (
     ThordataSerpTool,
     ThordataScrapeTool,
     ThordataUniversalTool,
     ThordataProxyTool,
+    ThordataToolError,
+    close_async_client,
+    ensure_dotenv,
 )
+from thordata_langchain_tools._cache import (
+    DEFAULT_TTL,
+    MAX_ENTRY_SIZE,
+    MISSING,
+    TTLCache,
+    get_cache,
+    make_key,
+)
+from thordata_langchain_tools._client import (
+    MAX_RETRIES,
+    POOL_MAXSIZE,
+    _async_clients,
+    _semaphores,
+    get_async_client,
+    get_semaphore,
+    get_shared_client,
+)
+from thordata_langchain_tools._env import ThordataEnv, get_env
+from thordata_langchain_tools._ratelimit import BACKOFF, host_backoff
+from thordata_langchain_tools.serp_tool import SerpSearchInput
 
 
 class TestThordataSerpTool:
@@ -31,15 +65,14 @@ class TestThordataSerpTool:
         tool = ThordataSerpTool()
         assert tool.args_schema is not None
 
-    @patch("thordata_langchain_tools.serp_tool.ThordataClient")
-    def test_run_success(self, mock_client_class):
+    def test_run_success(self, fake_client):
         """Test successful SERP search."""
-        # Setup mock
-        mock_client = MagicMock()
-        mock_client.serp_search.return_value = {
-            "organic": [{"title": "Test Result", "link": "https://example.com"}]
-        }
-        mock_client_class.return_value = mock_client
+        # Setup fake
+        fake_client.serp_search = MagicMock(
+            return_value={
+                "organic": [{"title": "Test Result", "link": "https://example.com"}]
+            }
+        )
 
         # Run tool
         tool = ThordataSerpTool()
@@ -48,19 +81,173 @@ class TestThordataSerpTool:
         # Verify
         assert "organic" in result
         assert len(result["organic"]) == 1
-        mock_client.serp_search.assert_called_once()
+        fake_client.serp_search.assert_called_once()
 
-    @patch("thordata_langchain_tools.serp_tool.ThordataClient")
-    def test_run_error_handling(self, mock_client_class):
+    def test_run_error_handling(self, fake_client):
         """Test error handling in SERP search."""
-        mock_client = MagicMock()
-        mock_client.serp_search.side_effect = Exception("API Error")
-        mock_client_class.return_value = mock_client
+        fake_client.serp_search = MagicMock(side_effect=Exception("API Error"))
+
+        tool = ThordataSerpTool()
+        result = tool._run(query="test", engine="google", num=5)
+
+        assert result["error"] == "API Error"
+        assert result["error_type"] == "Exception"
+
+    def test_run_caches_results(self, fake_client):
+        """Test repeated identical searches are served from cache."""
+        fake_client.serp_search = MagicMock(return_value={"organic": []})
+
+        tool = ThordataSerpTool()
+        first = tool._run(query="test", engine="google", num=5)
+        second = tool._run(query="test", engine="google", num=5)
+
+        assert first == second
+        fake_client.serp_search.assert_called_once()
+
+    def test_run_cache_ignores_query_case_and_spacing(self, fake_client):
+        """Test equivalent queries share one cache entry."""
+        fake_client.serp_search = MagicMock(return_value={"organic": []})
+
+        tool = ThordataSerpTool()
+        tool._run(query="Python  Tips", engine="google", num=5)
+        tool._run(query=" python tips", engine="Google", num=5)
+
+        fake_client.serp_search.assert_called_once()
+
+    def test_run_cached_results_are_isolated(self, fake_client):
+        """Test mutating a returned result does not change later cache hits."""
+        fake_client.serp_search = MagicMock(
+            return_value={"organic": [{"title": "Result"}]}
+        )
+
+        tool = ThordataSerpTool()
+        first = tool._run(query="test", engine="google", num=5)
+        first.pop("organic")
+        second = tool._run(query="test", engine="google", num=5)
+        second["organic"][0]["note"] = "seen"
+        third = tool._run(query="test", engine="google", num=5)
+
+        fake_client.serp_search.assert_called_once()
+        assert third == {"organic": [{"title": "Result"}]}
+
+    @pytest.mark.parametrize(
+        "results", [{"organic": [{"cid": 2**64 + 5}]}, {"organic": [], 1: "x"}]
+    )
+    def test_run_returns_results_that_cannot_be_cached(self, fake_client, results):
+        """Test results JSON cannot encode are returned, just not cached."""
+        pytest.importorskip("orjson")
+        fake_client.serp_search = MagicMock(return_value=results)
+
+        tool = ThordataSerpTool()
+        first = tool._run(query="test", engine="google", num=5)
+        second = tool._run(query="test", engine="google", num=5)
+
+        assert first == second == results
+        assert fake_client.serp_search.call_count == 2
+
+    def test_run_enable_cache_false_always_fetches(self, fake_client):
+        """Test disabling the cache on the tool forces fresh searches."""
+        fake_client.serp_search = MagicMock(return_value={"organic": []})
+
+        tool = ThordataSerpTool(enable_cache=False)
+        tool._run(query="test", engine="google", num=5)
+        tool._run(query="test", engine="google", num=5)
+
+        assert fake_client.serp_search.call_count == 2
+
+    def test_cache_ttl_env_disables_cache(self, fake_client, monkeypatch):
+        """Test THORDATA_CACHE_TTL=0 set after import disables caching."""
+        monkeypatch.setenv("THORDATA_CACHE_TTL", "0")
+        fake_client.serp_search = MagicMock(return_value={"organic": []})
+
+        tool = ThordataSerpTool()
+        tool._run(query="test", engine="google", num=5)
+        tool._run(query="test", engine="google", num=5)
+
+        assert fake_client.serp_search.call_count == 2
+
+    def test_run_does_not_cache_errors(self, fake_client):
+        """Test failed searches are retried rather than cached."""
+        fake_client.serp_search = MagicMock(side_effect=Exception("API Error"))
+
+        tool = ThordataSerpTool()
+        tool._run(query="test", engine="google", num=5)
+        tool._run(query="test", engine="google", num=5)
+
+        assert fake_client.serp_search.call_count == 2
+
+    def test_run_rate_limit_backs_off(self, fake_client):
+        """Test a rate-limit error holds back later searches."""
+        fake_client.serp_search = MagicMock(
+            side_effect=ThordataRateLimitError("Too many requests", retry_after=5)
+        )
 
         tool = ThordataSerpTool()
         result = tool._run(query="test", engine="google", num=5)
 
         assert "error" in result
+        assert 4 < BACKOFF.delay() <= 5
+
+    def test_arun_concurrent(self, fake_async_client):
+        """Test concurrent async SERP searches."""
+        fake_async_client.serp_search = AsyncMock(
+            return_value={"organic": [{"link": "https://example.com"}]}
+        )
+
+        tool = ThordataSerpTool()
+
+        async def run():
+            return await asyncio.gather(
+                *(tool._arun(query=f"query {i}") for i in range(3))
+            )
+
+        results = asyncio.run(run())
+
+        assert all("organic" in r for r in results)
+        assert fake_async_client.serp_search.await_count == 3
+
+    def test_batch_run_preserves_order(self, fake_client):
+        """Test batch searches return results in input order."""
+        fake_client.serp_search = lambda query, **kwargs: {"query": query}
+
+        tool = ThordataSerpTool()
+        inputs = [SerpSearchInput(query=f"query {i}") for i in range(5)]
+        results = tool.batch_run(inputs, max_workers=3)
+
+        assert [r["query"] for r in results] == [f"query {i}" for i in range(5)]
+
+    def test_abatch_run_preserves_order(self, fake_async_client):
+        """Test async batch searches return results in input order."""
+
+        async def serp_search(query, **kwargs):
+            return {"query": query}
+
+        fake_async_client.serp_search = serp_search
+
+        tool = ThordataSerpTool()
+        inputs = [SerpSearchInput(query=f"query {i}") for i in range(5)]
+        results = asyncio.run(tool.abatch_run(inputs, max_workers=2))
+
+        assert [r["query"] for r in results] == [f"query {i}" for i in range(5)]
+
+    def test_rejects_out_of_range_num(self, fake_client):
+        """Test an invalid result count fails before any request is made."""
+        fake_client.serp_search = MagicMock()
+
+        tool = ThordataSerpTool()
+        with pytest.raises(ValidationError):
+            tool.invoke({"query": "test", "num": 0})
+
+        fake_client.serp_search.assert_not_called()
+
+    def test_strips_query_whitespace(self, fake_client):
+        """Test string arguments are stripped during validation."""
+        fake_client.serp_search = MagicMock(return_value={"organic": []})
+
+        tool = ThordataSerpTool()
+        tool.invoke({"query": "  test  "})
+
+        assert fake_client.serp_search.call_args.kwargs["query"] == "test"
 
 
 class TestThordataScrapeTool:
@@ -76,25 +263,52 @@ class TestThordataScrapeTool:
         tool = ThordataScrapeTool()
         assert "scrape" in tool.description.lower()
 
-    @patch("thordata_langchain_tools.scrape_tool.ThordataClient")
-    def test_run_success(self, mock_client_class):
+    def test_rejects_unknown_arguments(self):
+        """Test unexpected tool arguments fail validation."""
+        tool = ThordataScrapeTool()
+        with pytest.raises(ValidationError):
+            tool.invoke({"url": "https://example.com", "output_format": "png"})
+
+    def test_run_success(self, fake_client):
         """Test successful scrape."""
-        mock_client = MagicMock()
-        mock_client.universal_scrape.return_value = "<html><body>Test</body></html>"
-        mock_client_class.return_value = mock_client
+        fake_client.universal_scrape = MagicMock(
+            return_value="<html><body>Test</body></html>"
+        )
 
         tool = ThordataScrapeTool()
         result = tool._run(url="https://example.com", js_render=False, max_length=1000)
 
         assert "html" in result.lower()
-        mock_client.universal_scrape.assert_called_once()
+        fake_client.universal_scrape.assert_called_once()
+
+    def test_run_error_handling(self, fake_client):
+        """Test failed scrapes return a typed error."""
+        fake_client.universal_scrape = MagicMock(side_effect=Exception("API Error"))
+
+        tool = ThordataScrapeTool()
+        result = tool._run(url="https://example.com")
+
+        assert isinstance(result, ThordataToolError)
+        assert result.url == "https://example.com"
+        assert "API Error" in str(result)
+        assert result.error_type == "Exception"
+
+    def test_run_cache_controls(self, fake_client):
+        """Test enable_cache=False and cache_ttl=0 both bypass the cache."""
+        fake_client.universal_scrape = MagicMock(return_value="<html></html>")
+
+        for tool in (
+            ThordataScrapeTool(enable_cache=False),
+            ThordataScrapeTool(cache_ttl=0),
+        ):
+            tool._run(url="https://example.com")
+            tool._run(url="https://example.com")
+
+        assert fake_client.universal_scrape.call_count == 4
 
-    @patch("thordata_langchain_tools.scrape_tool.ThordataClient")
-    def test_run_truncates_long_content(self, mock_client_class):
+    def test_run_truncates_long_content(self, fake_client):
         """Test that long content is truncated."""
-        mock_client = MagicMock()
-        mock_client.universal_scrape.return_value = "x" * 100000
-        mock_client_class.return_value = mock_client
+        fake_client.universal_scrape = lambda url, **kwargs: "x" * 100000
 
         tool = ThordataScrapeTool()
         result = tool._run(url="https://example.com", js_render=False, max_length=1000)
@@ -102,6 +316,29 @@ class TestThordataScrapeTool:
         assert len(result) < 2000
         assert "truncated" in result.lower()
 
+    def test_run_truncates_multibyte_bytes(self, fake_client):
+        """Test byte responses are truncated by characters, not bytes."""
+        page = ("\U0001f600" * 5000).encode()
+        fake_client.universal_scrape = lambda url, **kwargs: page
+
+        tool = ThordataScrapeTool()
+        result = tool._run(url="https://example.com", js_render=False, max_length=1000)
+
+        assert result.startswith("\U0001f600" * 1000)
+        assert result.endswith("[Content truncated...]")
+
+    def test_arun_truncates_long_content(self, fake_async_client):
+        """Test async scrape decodes and truncates content."""
+        fake_async_client.universal_scrape = AsyncMock(return_value=b"x" * 100000)
+
+        tool = ThordataScrapeTool()
+        result = asyncio.run(
+            tool._arun(url="https://example.com", js_render=False, max_length=1000)
+        )
+
+        assert isinstance(result, str)
+        assert "truncated" in result.lower()
+
 
 class TestThordataUniversalTool:
     """Tests for ThordataUniversalTool."""
@@ -119,12 +356,9 @@ class TestThordataUniversalTool:
             or "scraping" in tool.description.lower()
         )
 
-    @patch("thordata_langchain_tools.universal_tool.ThordataClient")
-    def test_run_with_js_render(self, mock_client_class):
+    def test_run_with_js_render(self, fake_client):
         """Test scrape with JS rendering."""
-        mock_client = MagicMock()
-        mock_client.universal_scrape.return_value = "<html>Rendered</html>"
-        mock_client_class.return_value = mock_client
+        fake_client.universal_scrape = MagicMock(return_value="<html>Rendered</html>")
 
         tool = ThordataUniversalTool()
         result = tool._run(
@@ -136,7 +370,7 @@ class TestThordataUniversalTool:
         )
 
         assert "html" in result.lower()
-        mock_client.universal_scrape.assert_called_once_with(
+        fake_client.universal_scrape.assert_called_once_with(
             url="https://example.com",
             js_render=True,
             output_format="html",
@@ -144,6 +378,62 @@ class TestThordataUniversalTool:
             wait_for=".content",
         )
 
+    def test_run_error_handling(self, fake_client):
+        """Test failed universal scrapes return a typed error."""
+        fake_client.universal_scrape = MagicMock(side_effect=Exception("API Error"))
+
+        tool = ThordataUniversalTool()
+        result = tool._run(url="https://example.com")
+
+        assert isinstance(result, ThordataToolError)
+        assert "API Error" in str(result)
+        assert result.error_type == "Exception"
+
+    def test_run_max_bytes_truncates_html(self, fake_client):
+        """Test max_bytes caps HTML output without splitting characters."""
+        fake_client.universal_scrape = MagicMock(
+            side_effect=["é" * 10, "é".encode("utf-8") * 10]
+        )
+
+        tool = ThordataUniversalTool()
+        text = tool._run(url="https://example.com", max_bytes=5)
+        raw = tool._run(url="https://example.com", js_render=False, max_bytes=5)
+
+        assert text == raw == "éé"
+
+    def test_run_does_not_cache_screenshots(self, fake_client):
+        """Test PNG results are fetched fresh every time."""
+        fake_client.universal_scrape = MagicMock(return_value=b"\x89PNG")
+
+        tool = ThordataUniversalTool()
+        tool._run(url="https://example.com", output_format="png")
+        tool._run(url="https://example.com", output_format="png")
+
+        assert fake_client.universal_scrape.call_count == 2
+
+    def test_arun_decodes_html(self, fake_async_client):
+        """Test async universal scrape decodes HTML bytes."""
+        fake_async_client.universal_scrape = AsyncMock(return_value=b"<html>ok</html>")
+
+        tool = ThordataUniversalTool()
+        result = asyncio.run(tool._arun(url="https://example.com", country="us"))
+
+        assert result == "<html>ok</html>"
+        fake_async_client.universal_scrape.assert_awaited_once()
+
+    def test_run_decodes_buffer_and_keeps_png_bytes(self, fake_client):
+        """Test HTML buffers are decoded while screenshots stay binary."""
+        fake_client.universal_scrape = MagicMock(
+            side_effect=[bytearray(b"<html>ok</html>"), b"\x89PNG"]
+        )
+
+        tool = ThordataUniversalTool()
+        html = tool._run(url="https://example.com", output_format="HTML")
+        png = tool._run(url="https://example.com", output_format="png")
+
+        assert html == "<html>ok</html>"
+        assert png == b"\x89PNG"
+
 
 class TestThordataProxyTool:
     """Tests for ThordataProxyTool."""
@@ -158,18 +448,365 @@ class TestThordataProxyTool:
         tool = ThordataProxyTool()
         assert "proxy" in tool.description.lower()
 
-    @patch("thordata_langchain_tools.proxy_tool.ThordataClient")
-    def test_run_basic_request(self, mock_client_class):
+    def test_run_basic_request(self, fake_client, make_response):
         """Test basic proxy request."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"origin": "1.2.3.4"}
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = MagicMock()
-        mock_client.get.return_value = mock_response
-        mock_client_class.return_value = mock_client
+        fake_client.get = lambda url, **kwargs: make_response(b'{"origin": "1.2.3.4"}')
 
         tool = ThordataProxyTool()
         result = tool._run(url="https://httpbin.org/ip")
 
-        assert "1.2.3.4" in result
+        assert result == '{"origin":"1.2.3.4"}'
+
+    def test_run_returns_text_for_non_json(self, fake_client, make_response):
+        """Test non-JSON responses are returned as text."""
+        fake_client.get = lambda url, **kwargs: make_response(
+            b"<html>ok</html>", text="<html>ok</html>"
+        )
+
+        tool = ThordataProxyTool()
+        result = tool._run(url="https://example.com")
+
+        assert result == "<html>ok</html>"
+
+    def test_run_honors_retry_after(self, fake_client, make_response):
+        """Test a 429 response holds back later requests to the same host only."""
+        fake_client.get = lambda url, **kwargs: make_response(
+            b"{}", status_code=429, headers={"Retry-After": "7"}
+        )
+
+        tool = ThordataProxyTool()
+        tool._run(url="https://httpbin.org/ip")
+
+        assert 6 < host_backoff("httpbin.org").delay() <= 7
+        assert host_backoff("example.com").delay() == 0
+        assert BACKOFF.delay() == 0
+
+    def test_run_geo_targeting_uses_env_credentials(self, fake_client, make_response):
+        """Test geo-targeted requests build a proxy config from the env."""
+        fake_client.get = MagicMock(return_value=make_response(b"{}"))
+
+        tool = ThordataProxyTool()
+        tool._run(url="https://httpbin.org/ip", country="jp")
+
+        proxy_config = fake_client.get.call_args.kwargs["proxy_config"]
+        assert proxy_config.username == "test_user"
+        assert proxy_config.country == "jp"
+
+    def test_run_reuses_proxy_config(self, fake_client, make_response):
+        """Test repeated geo-targets share one proxy config object."""
+        fake_client.get = MagicMock(return_value=make_response(b"{}"))
+
+        tool = ThordataProxyTool()
+        tool._run(url="https://httpbin.org/ip", country="de")
+        tool._run(url="https://example.com", country="de")
+
+        first, second = (
+            c.kwargs["proxy_config"] for c in fake_client.get.call_args_list
+        )
+        assert first is second
+
+    def test_run_error_handling(self, fake_client):
+        """Test failed proxy requests report the exception type."""
+        fake_client.get = MagicMock(side_effect=ConnectionError("refused"))
+
+        tool = ThordataProxyTool()
+        result = tool._run(url="https://example.com")
+
+        assert isinstance(result, ThordataToolError)
+        assert result.error_type == "ConnectionError"
+
+    def test_run_not_cached_by_default(self, fake_client, make_response):
+        """Test proxy responses are fetched fresh unless caching is enabled."""
+        fake_client.get = MagicMock(return_value=make_response(b"{}"))
+
+        for tool in (ThordataProxyTool(), ThordataProxyTool(enable_cache=True)):
+            tool._run(url="https://httpbin.org/ip")
+            tool._run(url="https://httpbin.org/ip")
+
+        assert fake_client.get.call_count == 3
+
+    def test_arun_runs_request_in_thread(self, fake_client, make_response):
+        """Test async proxy requests return the same result as sync ones."""
+        fake_client.get = MagicMock(return_value=make_response(b'{"ok": true}'))
+
+        tool = ThordataProxyTool()
+        result = asyncio.run(tool.ainvoke({"url": "https://httpbin.org/ip"}))
+
+        assert result == '{"ok":true}'
+        fake_client.get.assert_called_once()
+
+    def test_arun_respects_concurrency_limit(self, fake_client, make_response):
+        """Test concurrency_limit caps in-flight async proxy requests."""
+        lock = threading.Lock()
+        in_flight = peak = 0
+
+        def get(url, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            return make_response(b"{}")
+
+        fake_client.get = get
+        tool = ThordataProxyTool(concurrency_limit=2)
+
+        async def main():
+            await asyncio.gather(
+                *(tool._arun(url=f"https://example.com/{i}") for i in range(6))
+            )
+
+        asyncio.run(main())
+
+        assert peak == 2
+
+    def test_arun_backoff_does_not_hold_shared_semaphore(
+        self, fake_client, make_response
+    ):
+        """Test a backed-off host is waited out before taking a shared slot."""
+        fake_client.get = MagicMock(return_value=make_response(b"{}"))
+        host_backoff("slow.example").penalize(0.3)
+
+        async def main():
+            tool = ThordataProxyTool(concurrency_limit=1)
+            proxied = asyncio.create_task(tool._arun(url="https://slow.example/"))
+            await asyncio.sleep(0.05)
+
+            # Another tool sharing the limit still gets the slot right away
+            start = time.monotonic()
+            async with get_semaphore(1):
+                waited = time.monotonic() - start
+            await proxied
+            return waited
+
+        assert asyncio.run(main()) < 0.1
+
+
+class TestSharedClient:
+    """Tests for the shared Thordata client."""
+
+    def test_tools_share_one_client(self):
+        """Test every tool instance reuses the same client."""
+        clients = {
+            id(tool._get_client())
+            for tool in (
+                ThordataSerpTool(),
+                ThordataScrapeTool(),
+                ThordataUniversalTool(),
+                ThordataProxyTool(),
+            )
+        }
+
+        assert clients == {id(get_shared_client())}
+
+    def test_missing_token_fails_at_construction(self, monkeypatch):
+        """Test tools validate credentials when created, not when run."""
+        monkeypatch.delenv("THORDATA_SCRAPER_TOKEN")
+        get_env.cache_clear()
+
+        for tool_cls in (
+            ThordataSerpTool,
+            ThordataScrapeTool,
+            ThordataUniversalTool,
+            ThordataProxyTool,
+        ):
+            with pytest.raises(ValueError, match="THORDATA_SCRAPER_TOKEN"):
+                tool_cls()
+
+    def test_token_set_after_failure_is_picked_up(self, monkeypatch):
+        """Test a missing token is not cached for the rest of the process."""
+        monkeypatch.delenv("THORDATA_SCRAPER_TOKEN")
+        get_env.cache_clear()
+        with pytest.raises(ValueError):
+            ThordataSerpTool()
+
+        monkeypatch.setenv("THORDATA_SCRAPER_TOKEN", "late_token")
+
+        assert ThordataSerpTool()._get_client().scraper_token == "late_token"
+
+    def test_new_credentials_get_new_client(self, monkeypatch):
+        """Test changing the token builds a separate client."""
+        first = get_shared_client()
+
+        monkeypatch.setenv("THORDATA_SCRAPER_TOKEN", "other_token")
+        get_env.cache_clear()
+
+        assert get_shared_client() is not first
+        assert get_shared_client().scraper_token == "other_token"
+
+    def test_async_clients_closed_with_their_loop(self, fake_async_client):
+        """Test repeated asyncio.run calls do not accumulate async clients."""
+
+        async def use_client():
+            get_async_client()
+            get_semaphore()
+
+        for _ in range(5):
+            asyncio.run(use_client())
+        gc.collect()
+
+        assert len(_async_clients) == 0
+        assert len(_semaphores) == 0
+        assert fake_async_client.closed == 5
+
+    def test_close_async_client_on_manual_loop(self, fake_async_client):
+        """Test closing the client before closing a manual loop leaves nothing."""
+
+        async def use_and_close():
+            get_async_client()
+            await close_async_client()
+
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(use_and_close())
+        loop.close()
+
+        assert loop not in _async_clients
+        assert fake_async_client.closed == 1
+
+    def test_closed_loops_are_evicted(self, fake_async_client):
+        """Test clients of loops closed without cleanup are closed later."""
+
+        async def use_client():
+            get_async_client()
+
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(use_client())
+        loop.close()
+        assert loop in _async_clients
+
+        asyncio.run(use_client())
+
+        assert loop not in _async_clients
+        # The abandoned client and the one from asyncio.run are both closed
+        assert fake_async_client.closed == 2
+
+    def test_client_has_enlarged_pool(self):
+        """Test the shared client mounts a larger connection pool."""
+        session = get_shared_client()._http._session
+        adapter = session.get_adapter("https://scraperapi.thordata.com")
+
+        assert adapter._pool_maxsize == POOL_MAXSIZE
+
+    def test_missing_sdk_session_warns(self, monkeypatch):
+        """Test an SDK without the expected session is reported, not skipped."""
+        monkeypatch.setattr(
+            "thordata_langchain_tools._client.ThordataClient",
+            lambda **kwargs: types.SimpleNamespace(),
+        )
+
+        with pytest.warns(RuntimeWarning, match="connection pool"):
+            get_shared_client()
+
+    def test_client_retries_transient_errors(self):
+        """Test the shared client retries rate limits and server errors."""
+        retry_config = get_shared_client()._retry_config
+
+        assert retry_config.max_retries == MAX_RETRIES
+        assert {429, 500, 502, 503, 504} <= retry_config.retry_on_status_codes
+
+
+class TestValueTypes:
+    """Tests for the frozen value types returned and cached by the tools."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            ThordataToolError(
+                url="https://example.com", message="API Error", error_type="Exception"
+            ),
+            ThordataEnv("token", "public", "key", "user", "pass"),
+        ],
+    )
+    def test_copy_and_pickle_round_trip(self, value):
+        """Test frozen slotted values survive copy, deepcopy and pickle."""
+        assert copy.copy(value) == value
+        assert copy.deepcopy(value) == value
+        assert pickle.loads(pickle.dumps(value)) == value
+
+
+class TestDotenv:
+    """Tests for optional .env loading."""
+
+    def test_loads_dotenv_only_once(self, monkeypatch):
+        """Test repeated ensure_dotenv() calls read .env a single time."""
+        import dotenv
+
+        load_dotenv = MagicMock()
+        monkeypatch.setattr(dotenv, "load_dotenv", load_dotenv)
+        monkeypatch.delenv("THORDATA_LOAD_DOTENV", raising=False)
+        ensure_dotenv.cache_clear()
+
+        ensure_dotenv()
+        ensure_dotenv()
+        ensure_dotenv.cache_clear()
+
+        load_dotenv.assert_called_once()
+
+    def test_load_dotenv_opt_out(self, monkeypatch):
+        """Test THORDATA_LOAD_DOTENV=0 skips reading .env."""
+        import dotenv
+
+        load_dotenv = MagicMock()
+        monkeypatch.setattr(dotenv, "load_dotenv", load_dotenv)
+        monkeypatch.setenv("THORDATA_LOAD_DOTENV", "0")
+        ensure_dotenv.cache_clear()
+
+        ensure_dotenv()
+        ensure_dotenv.cache_clear()
+
+        load_dotenv.assert_not_called()
+
+
+class TestTTLCache:
+    """Tests for the shared response cache."""
+
+    def test_key_ignores_param_order(self):
+        """Test keys are stable regardless of keyword order."""
+        assert make_key("tool", a=1, b=2) == make_key("tool", b=2, a=1)
+        assert make_key("tool", a=1) != make_key("other", a=1)
+
+    def test_make_key_is_compact_and_ignores_none(self):
+        """Test keys are 128-bit and unset parameters do not change them."""
+        assert len(make_key("tool", a=1)) == 16
+        assert make_key("tool", a=1, b=None) == make_key("tool", a=1)
+
+    def test_skips_oversized_values(self):
+        """Test payloads above MAX_ENTRY_SIZE are not cached."""
+        cache = TTLCache(ttl=60)
+        cache.set(b"big", "x" * (MAX_ENTRY_SIZE + 1))
+        cache.set(b"small", "x")
+
+        assert cache.get(b"big") is MISSING
+        assert cache.get(b"small") == "x"
+
+    def test_malformed_ttl_env_uses_default(self, monkeypatch):
+        """Test an unparsable THORDATA_CACHE_TTL falls back to the default."""
+        monkeypatch.setenv("THORDATA_CACHE_TTL", "10m")
+
+        assert get_cache().ttl == DEFAULT_TTL
+
+    def test_zero_ttl_disables_cache(self):
+        """Test a TTL of zero never stores values."""
+        cache = TTLCache(ttl=0)
+        cache.set(b"key", "value")
+        assert cache.get(b"key") is MISSING
+
+    def test_per_entry_ttl_overrides_default(self):
+        """Test an entry TTL of zero skips storing the value."""
+        cache = TTLCache(ttl=60)
+        cache.set(b"key", "value", ttl=0)
+        assert cache.get(b"key") is MISSING
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest entry is evicted once maxsize is exceeded."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set(b"a", 1)
+        cache.set(b"b", 2)
+        cache.get(b"a")
+        cache.set(b"c", 3)
+
+        assert cache.get(b"a") == 1
+        assert cache.get(b"b") is MISSING
+        assert cache.get(b"c") == 3
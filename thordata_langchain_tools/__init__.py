@@ -22,6 +22,9 @@ from .serp_tool import ThordataSerpTool
 from .scrape_tool import ThordataScrapeTool
 from .universal_tool import ThordataUniversalTool
 from .proxy_tool import ThordataProxyTool
+from .errors import ThordataToolError
+from ._client import close_async_client
+from ._dotenv import ensure_dotenv
 
 __all__ = [
     "__version__",
@@ -29,4 +32,7 @@ __all__ = [
     "ThordataScrapeTool",
     "ThordataUniversalTool",
     "ThordataProxyTool",
+    "ThordataToolError",
+    "close_async_client",
+    "ensure_dotenv",
 ]
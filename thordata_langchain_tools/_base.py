@@ -0,0 +1,55 @@
+"""
+Base class holding the client, settings and caching shared by the tools.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from langchain_core.tools import BaseTool
+from pydantic import PrivateAttr
+
+from thordata import ThordataClient
+
+from ._cache import MISSING, get_cache, make_key
+from ._client import DEFAULT_CONCURRENCY_LIMIT, get_shared_client
+
+
+class ThordataBaseTool(BaseTool):
+    """Shared client, common fields and response-cache helpers for the tools."""
+
+    concurrency_limit: int = DEFAULT_CONCURRENCY_LIMIT
+
+    # Set enable_cache=False to always fetch fresh results; cache_ttl
+    # overrides THORDATA_CACHE_TTL (in seconds) for this tool's results.
+    enable_cache: bool = True
+    cache_ttl: Optional[float] = None
+
+    _client: ThordataClient = PrivateAttr()
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        # Resolve the client up front so a missing THORDATA_SCRAPER_TOKEN
+        # fails at construction rather than mid-way through an agent run.
+        self._client = get_shared_client()
+
+    def _get_client(self) -> ThordataClient:
+        """Get the shared Thordata client."""
+        return self._client
+
+    def _cache_key(self, **params: Any) -> Optional[bytes]:
+        """Cache key for a call, or ``None`` when caching is disabled."""
+        if not self.enable_cache:
+            return None
+        return make_key(self.name, **params)
+
+    def _cache_get(self, key: Optional[bytes]) -> Any:
+        """Return the cached result for ``key``, or ``MISSING``."""
+        if key is None:
+            return MISSING
+        return get_cache().get(key)
+
+    def _cache_set(self, key: Optional[bytes], value: Any) -> None:
+        """Cache ``value`` under ``key`` for this tool's TTL."""
+        if key is not None:
+            get_cache().set(key, value, ttl=self.cache_ttl)
@@ -0,0 +1,136 @@
+"""
+In-process response cache shared by the Thordata LangChain tools.
+
+Identical tool calls made within ``THORDATA_CACHE_TTL`` seconds (default 600)
+are answered from memory instead of hitting the Thordata API again. Set
+``THORDATA_CACHE_TTL=0`` to disable caching. If ``THORDATA_CACHE_DIR`` is set
+and ``diskcache`` is installed, responses are persisted there so separate
+processes can share them. Both settings are read on first use, so they may
+come from a ``.env`` file loaded after importing this package. Text and
+byte values longer than ``MAX_ENTRY_SIZE`` are not cached, so a few large
+pages cannot pin an unbounded amount of memory.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+DEFAULT_MAXSIZE = 512
+DEFAULT_TTL = 600.0
+
+# Longest str (characters) or bytes value worth caching.
+MAX_ENTRY_SIZE = 1024 * 1024
+
+# Returned by ``get`` on a cache miss (``None`` is a valid cached value).
+MISSING = object()
+
+
+def make_key(namespace: str, **params: Any) -> bytes:
+    """
+    Build a 16-byte cache key from a tool name and its call parameters.
+
+    Parameters set to ``None`` are dropped, and the rest are serialized as
+    canonical JSON, so the key is stable across processes and runs.
+    """
+    params = {name: value for name, value in params.items() if value is not None}
+    payload = json.dumps(
+        [namespace, params], sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+
+def _too_large(value: Any) -> bool:
+    """Whether ``value`` is a text or byte payload too large to cache."""
+    return isinstance(value, (str, bytes, bytearray)) and len(value) > MAX_ENTRY_SIZE
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire ``ttl`` seconds after insert."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl: float = DEFAULT_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[bytes, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: bytes) -> Any:
+        """Return the cached value for ``key``, or ``MISSING``."""
+        if self.ttl <= 0:
+            return MISSING
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return MISSING
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: bytes, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store ``value`` under ``key``, evicting the least recently used.
+
+        ``ttl`` overrides the cache-wide TTL for this entry; it cannot
+        re-enable a cache that was disabled with a TTL of zero.
+        """
+        if ttl is None:
+            ttl = self.ttl
+        if self.ttl <= 0 or ttl <= 0 or _too_large(value):
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._data.clear()
+
+
+class DiskCache:
+    """``diskcache``-backed cache with the same interface as ``TTLCache``."""
+
+    def __init__(self, directory: str, ttl: float = DEFAULT_TTL):
+        import diskcache
+
+        self.ttl = ttl
+        self._cache = diskcache.Cache(directory)
+
+    def get(self, key: bytes) -> Any:
+        return self._cache.get(key, default=MISSING)
+
+    def set(self, key: bytes, value: Any, ttl: Optional[float] = None) -> None:
+        if ttl is None:
+            ttl = self.ttl
+        if ttl > 0 and not _too_large(value):
+            self._cache.set(key, value, expire=ttl)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+@functools.lru_cache(maxsize=1)
+def get_cache() -> Any:
+    """Get the process-wide cache, configured from the environment on first use."""
+    try:
+        ttl = float(os.getenv("THORDATA_CACHE_TTL", DEFAULT_TTL))
+    except ValueError:
+        ttl = DEFAULT_TTL
+    cache_dir = os.getenv("THORDATA_CACHE_DIR")
+    if cache_dir and ttl > 0:
+        try:
+            return DiskCache(cache_dir, ttl=ttl)
+        except ImportError:
+            pass
+    return TTLCache(maxsize=DEFAULT_MAXSIZE, ttl=ttl)
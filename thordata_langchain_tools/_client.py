@@ -0,0 +1,189 @@
+"""
+Shared Thordata client helpers used by the LangChain tools.
+
+The sync client is a process-wide singleton with an enlarged connection
+pool, and the async client is cached per running event loop, so tool calls
+reuse keep-alive connections instead of opening new ones per call.
+
+An async client is closed when its loop shuts down under ``asyncio.run``
+(which cancels leftover tasks first). Loops driven any other way should
+``await close_async_client()`` before they are closed; failing that, the
+client is closed, best effort, the next time one is requested.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import warnings
+import weakref
+from typing import Dict, Set, Tuple
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+from thordata import AsyncThordataClient, ThordataClient
+from thordata.retry import RetryConfig
+
+from ._env import get_env
+
+# Default number of in-flight async requests per event loop.
+DEFAULT_CONCURRENCY_LIMIT = 20
+
+# Connection pools (one per host) and keep-alive sockets per pool held by
+# the shared sync client, sized for parallel tool fan-out.
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+# Retries for transient failures (429 and 5xx by default in the SDK).
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.25
+
+_async_clients: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, "
+    "Tuple[AsyncThordataClient, asyncio.Task]]"
+) = weakref.WeakKeyDictionary()
+# Strong references to in-progress closes of clients left by closed loops.
+_closing: Set[asyncio.Task] = set()
+_semaphores: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[int, asyncio.Semaphore]]"
+) = weakref.WeakKeyDictionary()
+
+
+def _retry_config() -> RetryConfig:
+    """Retry policy shared by the sync and async clients."""
+    return RetryConfig(max_retries=MAX_RETRIES, backoff_factor=RETRY_BACKOFF_FACTOR)
+
+
+def _credentials() -> Dict[str, str]:
+    """Read the Thordata API credentials from the environment."""
+    env = get_env()
+    if not env.scraper_token:
+        # Re-read the environment next time, in case the token is set later
+        get_env.cache_clear()
+        raise ValueError(
+            "THORDATA_SCRAPER_TOKEN environment variable is required. "
+            "Get your token from the Thordata Dashboard."
+        )
+
+    return {
+        "scraper_token": env.scraper_token,
+        "public_token": env.public_token,
+        "public_key": env.public_key,
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _get_shared_client(
+    scraper_token: str, public_token: str, public_key: str
+) -> ThordataClient:
+    """Build the sync Thordata client for one set of credentials."""
+    client = ThordataClient(
+        scraper_token=scraper_token,
+        public_token=public_token,
+        public_key=public_key,
+        retry_config=_retry_config(),
+    )
+
+    # Retries are left to the SDK's RetryConfig, so the adapter itself must
+    # not retry; it only raises the pool limits. The session is private SDK
+    # state (ThordataHttpSession, thordata-sdk 1.5+), so say so if it moves.
+    session = getattr(getattr(client, "_http", None), "_session", None)
+    if not isinstance(session, Session):
+        warnings.warn(
+            "Could not find the Thordata SDK's requests session; the shared "
+            "client keeps the default connection pool size.",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        return client
+
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=0,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return client
+
+
+def get_shared_client() -> ThordataClient:
+    """Get the process-wide sync Thordata client for the configured credentials."""
+    return _get_shared_client(**_credentials())
+
+
+async def _close_quietly(client: AsyncThordataClient) -> None:
+    """Close ``client``, ignoring errors from its dead loop's transports."""
+    try:
+        await client.close()
+    except Exception:
+        pass
+
+
+def _evict_closed_loops() -> None:
+    """
+    Drop state kept for event loops that have been closed.
+
+    The cached clients and semaphores reference their loop, so the weak
+    keys alone would never be released. A client whose loop closed without
+    cancelling its closer task is closed from the running loop instead.
+    """
+    for loop in [loop for loop in _semaphores if loop.is_closed()]:
+        del _semaphores[loop]
+
+    for loop in [loop for loop in _async_clients if loop.is_closed()]:
+        client, closer = _async_clients.pop(loop)
+        # The closer can never run now; don't report it as destroyed pending
+        closer._log_destroy_pending = False
+        task = asyncio.get_running_loop().create_task(_close_quietly(client))
+        _closing.add(task)
+        task.add_done_callback(_closing.discard)
+
+
+async def _close_at_shutdown(
+    loop: asyncio.AbstractEventLoop, client: AsyncThordataClient
+) -> None:
+    """Wait until cancelled at loop shutdown, then close ``client``."""
+    try:
+        await loop.create_future()
+    finally:
+        entry = _async_clients.get(loop)
+        if entry is not None and entry[0] is client:
+            del _async_clients[loop]
+        _semaphores.pop(loop, None)
+        await client.close()
+
+
+def get_async_client() -> AsyncThordataClient:
+    """Get or create the async Thordata client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    entry = _async_clients.get(loop)
+    if entry is None:
+        _evict_closed_loops()
+        client = AsyncThordataClient(retry_config=_retry_config(), **_credentials())
+        closer = loop.create_task(_close_at_shutdown(loop, client))
+        entry = _async_clients[loop] = (client, closer)
+    return entry[0]
+
+
+def get_semaphore(limit: int = DEFAULT_CONCURRENCY_LIMIT) -> asyncio.Semaphore:
+    """Get the semaphore bounding in-flight requests on the running event loop."""
+    loop = asyncio.get_running_loop()
+    if loop not in _semaphores:
+        _evict_closed_loops()
+    by_limit = _semaphores.setdefault(loop, {})
+    semaphore = by_limit.get(limit)
+    if semaphore is None:
+        semaphore = by_limit[limit] = asyncio.Semaphore(limit)
+    return semaphore
+
+
+async def close_async_client() -> None:
+    """Close the async client bound to the running event loop, if any."""
+    entry = _async_clients.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        client, closer = entry
+        closer.cancel()
+        await asyncio.wait([closer])
+        await client.close()
@@ -0,0 +1,23 @@
+"""
+Load a local ``.env`` file at most once per process.
+
+Set ``THORDATA_LOAD_DOTENV=0`` where the environment is injected directly
+(containers, serverless) to skip the upward ``.env`` file search and the
+``python-dotenv`` import altogether.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+
+
+@functools.lru_cache(maxsize=1)
+def ensure_dotenv() -> None:
+    """Load ``.env`` into ``os.environ`` the first time this is called."""
+    if os.getenv("THORDATA_LOAD_DOTENV", "1") == "0":
+        return
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
@@ -0,0 +1,42 @@
+"""
+Thordata credentials read from the environment.
+
+The environment is read once, on first use, rather than at import time so
+that ``load_dotenv()`` may still be called after importing this package.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+from dataclasses import astuple, dataclass
+from typing import Any, Tuple
+
+
+@dataclass(frozen=True)
+class ThordataEnv:
+    """Snapshot of the ``THORDATA_*`` environment variables."""
+
+    __slots__ = ("scraper_token", "public_token", "public_key", "username", "password")
+
+    scraper_token: str
+    public_token: str
+    public_key: str
+    username: str
+    password: str
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Rebuild through __init__; see ThordataToolError.__reduce__
+        return (type(self), astuple(self))
+
+
+@functools.lru_cache(maxsize=1)
+def get_env() -> ThordataEnv:
+    """Read the Thordata environment variables once and cache them."""
+    return ThordataEnv(
+        scraper_token=os.getenv("THORDATA_SCRAPER_TOKEN", ""),
+        public_token=os.getenv("THORDATA_PUBLIC_TOKEN", ""),
+        public_key=os.getenv("THORDATA_PUBLIC_KEY", ""),
+        username=os.getenv("THORDATA_USERNAME", ""),
+        password=os.getenv("THORDATA_PASSWORD", ""),
+    )
@@ -0,0 +1,30 @@
+"""
+JSON helpers that use ``orjson`` when it is installed.
+
+Falls back to the standard library ``json`` module otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        """Serialize ``obj`` to a compact JSON string."""
+        return orjson.dumps(obj).decode("utf-8")
+
+else:  # pragma: no cover - depends on installed extras
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> str:
+        """Serialize ``obj`` to a compact JSON string."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
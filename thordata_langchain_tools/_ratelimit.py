@@ -0,0 +1,85 @@
+"""
+Process-wide backoff shared by the tools after Thordata rate-limits us.
+
+When one call is told to slow down, later calls wait out the suggested
+delay before sending, instead of spending a round trip on another 429.
+``BACKOFF`` reacts only to Thordata's own rate limits; rate limits from
+sites fetched through the proxy are tracked per host by ``host_backoff``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+import time
+from typing import Mapping, Optional
+
+# Pause used when the provider rate-limits us without saying for how long.
+DEFAULT_BACKOFF = 1.0
+
+# Upper bound on any single pause, whatever Retry-After asks for.
+MAX_BACKOFF = 60.0
+
+
+class Backoff:
+    """Tracks until when requests should be held back."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._until = 0.0
+
+    def penalize(self, seconds: Optional[float] = None) -> None:
+        """Hold back requests for ``seconds`` (capped at ``MAX_BACKOFF``)."""
+        if seconds is None or seconds <= 0:
+            seconds = DEFAULT_BACKOFF
+        until = time.monotonic() + min(seconds, MAX_BACKOFF)
+        with self._lock:
+            self._until = max(self._until, until)
+
+    def delay(self) -> float:
+        """Seconds left before requests may be sent again."""
+        return max(0.0, self._until - time.monotonic())
+
+    def wait(self) -> None:
+        """Block the calling thread until requests may be sent."""
+        delay = self.delay()
+        if delay:
+            time.sleep(delay)
+
+    async def await_ready(self) -> None:
+        """Sleep without blocking the event loop until requests may be sent."""
+        delay = self.delay()
+        if delay:
+            await asyncio.sleep(delay)
+
+    def reset(self) -> None:
+        """Clear any pending backoff."""
+        with self._lock:
+            self._until = 0.0
+
+
+def backoff_from_headers(
+    status_code: int, headers: Mapping[str, str]
+) -> Optional[float]:
+    """
+    Return the pause requested by a response, or ``None`` if it asks for none.
+
+    A 429 status or an exhausted ``X-RateLimit-Remaining`` counts as a request
+    to slow down; ``Retry-After`` (in seconds) sets the length when present.
+    """
+    if status_code != 429 and headers.get("X-RateLimit-Remaining") != "0":
+        return None
+    try:
+        return float(headers.get("Retry-After", DEFAULT_BACKOFF))
+    except ValueError:
+        return DEFAULT_BACKOFF
+
+
+BACKOFF = Backoff()
+
+
+@functools.lru_cache(maxsize=256)
+def host_backoff(host: str) -> Backoff:
+    """Get the backoff for one target host (recently used hosts are kept)."""
+    return Backoff()
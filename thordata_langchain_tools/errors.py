@@ -0,0 +1,40 @@
+"""
+Typed error results returned by the Thordata LangChain tools.
+"""
+
+from __future__ import annotations
+
+from dataclasses import astuple, dataclass
+from typing import Any, Tuple
+
+
+@dataclass(frozen=True)
+class ThordataToolError:
+    """
+    Returned instead of page content when a Thordata request fails.
+
+    Check for it with ``isinstance(result, ThordataToolError)`` rather than
+    inspecting the returned text. ``str()`` gives a readable message, which
+    is what an LLM sees when the tool runs inside an agent. ``error_type``
+    names the exception class (for example ``ThordataRateLimitError``), so
+    callers can tell retryable failures apart without parsing the message.
+    """
+
+    __slots__ = ("url", "message", "error_type")
+
+    url: str
+    message: str
+    error_type: str
+
+    @classmethod
+    def from_exception(cls, url: str, error: Exception) -> ThordataToolError:
+        """Describe ``error`` raised while requesting ``url``."""
+        return cls(url=url, message=str(error), error_type=type(error).__name__)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Frozen slotted dataclasses can't restore state by attribute
+        # assignment, so copy and pickle rebuild through __init__ instead
+        return (type(self), astuple(self))
+
+    def __str__(self) -> str:
+        return f"Error requesting {self.url}: {self.message}"
@@ -6,19 +6,33 @@ Make HTTP requests through Thordata's proxy network with geo-targeting.
 
 from __future__ import annotations
 
-import os
-from typing import Optional, Type
+import asyncio
+import functools
+from typing import Optional, Type, Union
+from urllib.parse import urlsplit
 
-from langchain_core.tools import BaseTool
-from langchain_core.callbacks import CallbackManagerForToolRun
-from pydantic import BaseModel, Field
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForToolRun,
+    CallbackManagerForToolRun,
+)
+from pydantic import BaseModel, ConfigDict, Field
 
-from thordata import ThordataClient, ProxyConfig
+from thordata import ProxyConfig
+
+from ._base import ThordataBaseTool
+from ._cache import MISSING
+from ._client import get_semaphore
+from ._env import get_env
+from ._json import _dumps, _loads
+from ._ratelimit import Backoff, backoff_from_headers, host_backoff
+from .errors import ThordataToolError
 
 
 class ProxyRequestInput(BaseModel):
     """Input schema for proxy requests."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     url: str = Field(description="The URL to request.")
     country: Optional[str] = Field(
         default=None,
@@ -33,7 +47,35 @@ class ProxyRequestInput(BaseModel):
     )
 
 
-class ThordataProxyTool(BaseTool):
+@functools.lru_cache(maxsize=256)
+def _make_proxy_config(
+    username: str,
+    password: str,
+    country: Optional[str],
+    state: Optional[str],
+    city: Optional[str],
+) -> ProxyConfig:
+    """Build (and reuse) the proxy config for a geo-targeting combination."""
+    return ProxyConfig(
+        username=username,
+        password=password,
+        country=country,
+        state=state,
+        city=city,
+    )
+
+
+def _target_backoff(url: str) -> Backoff:
+    """
+    Backoff for the host ``url`` points at.
+
+    Proxied responses come from the target site, so a rate limit there only
+    holds back later requests to that same host.
+    """
+    return host_backoff(urlsplit(url).netloc.lower())
+
+
+class ThordataProxyTool(ThordataBaseTool):
     """
     LangChain tool for making geo-targeted HTTP requests via Thordata proxy.
 
@@ -57,23 +99,9 @@ class ThordataProxyTool(BaseTool):
     )
     args_schema: Type[BaseModel] = ProxyRequestInput
 
-    _client: Optional[ThordataClient] = None
-
-    def _get_client(self) -> ThordataClient:
-        """Get or create the Thordata client."""
-        if self._client is None:
-            scraper_token = os.getenv("THORDATA_SCRAPER_TOKEN")
-            if not scraper_token:
-                raise ValueError(
-                    "THORDATA_SCRAPER_TOKEN environment variable is required."
-                )
-
-            self._client = ThordataClient(
-                scraper_token=scraper_token,
-                public_token=os.getenv("THORDATA_PUBLIC_TOKEN", ""),
-                public_key=os.getenv("THORDATA_PUBLIC_KEY", ""),
-            )
-        return self._client
+    # Proxied responses reflect the exit IP and live page state, so they are
+    # only cached when asked for with enable_cache=True.
+    enable_cache: bool = False
 
     def _run(
         self,
@@ -82,34 +110,62 @@ class ThordataProxyTool(BaseTool):
         state: Optional[str] = None,
         city: Optional[str] = None,
         run_manager: Optional[CallbackManagerForToolRun] = None,
-    ) -> str:
+    ) -> Union[str, ThordataToolError]:
         """Make the proxy request."""
+        key = self._cache_key(url=url, country=country, state=state, city=city)
+        cached = self._cache_get(key)
+        if cached is not MISSING:
+            return cached
+
         client = self._get_client()
 
         try:
             # Build proxy config if geo-targeting specified
             proxy_config = None
             if country or state or city:
-                username = os.getenv("THORDATA_USERNAME", "")
-                password = os.getenv("THORDATA_PASSWORD", "")
-
-                if username and password:
-                    proxy_config = ProxyConfig(
-                        username=username,
-                        password=password,
-                        country=country,
-                        state=state,
-                        city=city,
+                env = get_env()
+
+                if env.username and env.password:
+                    proxy_config = _make_proxy_config(
+                        env.username, env.password, country, state, city
                     )
 
+            backoff = _target_backoff(url)
+            backoff.wait()
             response = client.get(url, proxy_config=proxy_config, timeout=30)
+
+            pause = backoff_from_headers(response.status_code, response.headers)
+            if pause is not None:
+                backoff.penalize(pause)
+
             response.raise_for_status()
 
             # Try to return JSON if possible, otherwise text
             try:
-                return str(response.json())
+                result = _dumps(_loads(response.content))
             except Exception:
-                return response.text[:50000]  # Limit response size
+                result = response.text[:50000]  # Limit response size
+
+            self._cache_set(key, result)
+            return result
 
         except Exception as e:
-            return f"Error requesting {url}: {str(e)}"
+            return ThordataToolError.from_exception(url, e)
+
+    async def _arun(
+        self,
+        url: str,
+        country: Optional[str] = None,
+        state: Optional[str] = None,
+        city: Optional[str] = None,
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+    ) -> Union[str, ThordataToolError]:
+        """Make the proxy request without blocking the event loop."""
+        # Wait out any backoff before taking a slot in the semaphore shared
+        # with the other tools, so a rate-limited host cannot stall them.
+        await _target_backoff(url).await_ready()
+
+        # The SDK's aiohttp client cannot tunnel through https:// upstream
+        # proxies, so run the sync request in a worker thread instead.
+        async with get_semaphore(self.concurrency_limit):
+            return await asyncio.to_thread(self._run, url, country, state, city)
@@ -6,19 +6,26 @@ Fetches and returns HTML content from URLs via Thordata Universal API.
 
 from __future__ import annotations
 
-import os
-from typing import Optional, Type
+from typing import Optional, Type, Union
 
-from langchain_core.tools import BaseTool
-from langchain_core.callbacks import CallbackManagerForToolRun
-from pydantic import BaseModel, Field
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForToolRun,
+    CallbackManagerForToolRun,
+)
+from pydantic import BaseModel, ConfigDict, Field
 
-from thordata import ThordataClient
+
+from ._base import ThordataBaseTool
+from ._cache import MISSING
+from ._client import get_async_client, get_semaphore
+from .errors import ThordataToolError
 
 
 class ScrapeInput(BaseModel):
     """Input schema for web scraping."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     url: str = Field(description="The URL of the webpage to scrape.")
     js_render: bool = Field(
         default=False,
@@ -30,7 +37,35 @@ class ScrapeInput(BaseModel):
     )
 
 
-class ThordataScrapeTool(BaseTool):
+# Appended to pages cut down to max_length
+_TRUNCATION_TAIL = "\n\n[Content truncated...]"
+
+# Upper bound on UTF-8 bytes needed to encode one character
+_MAX_UTF8_BYTES = 4
+
+
+def _truncate(result: Union[str, bytes], max_length: int) -> str:
+    """
+    Decode the scraped page and truncate it to ``max_length`` characters.
+
+    The Universal API wraps the page in a JSON envelope that the SDK must
+    parse in full to detect errors, so the response cannot be streamed and
+    cut off early; truncation therefore happens here, after the fetch.
+    """
+    # Convert to string if needed, decoding only enough bytes to hold
+    # max_length + 1 characters so we can still tell the page was cut
+    if isinstance(result, bytes):
+        view = memoryview(result)[: (max_length + 1) * _MAX_UTF8_BYTES]
+        result = str(view, "utf-8", "ignore")
+
+    if len(result) <= max_length:
+        return result
+
+    # Truncate to max_length to control token usage
+    return "".join((result[:max_length], _TRUNCATION_TAIL))
+
+
+class ThordataScrapeTool(ThordataBaseTool):
     """
     LangChain tool for scraping web pages via Thordata Universal API.
 
@@ -55,33 +90,19 @@ class ThordataScrapeTool(BaseTool):
     )
     args_schema: Type[BaseModel] = ScrapeInput
 
-    # Client instance
-    _client: Optional[ThordataClient] = None
-
-    def _get_client(self) -> ThordataClient:
-        """Get or create the Thordata client."""
-        if self._client is None:
-            scraper_token = os.getenv("THORDATA_SCRAPER_TOKEN")
-            if not scraper_token:
-                raise ValueError(
-                    "THORDATA_SCRAPER_TOKEN environment variable is required."
-                )
-
-            self._client = ThordataClient(
-                scraper_token=scraper_token,
-                public_token=os.getenv("THORDATA_PUBLIC_TOKEN", ""),
-                public_key=os.getenv("THORDATA_PUBLIC_KEY", ""),
-            )
-        return self._client
-
     def _run(
         self,
         url: str,
         js_render: bool = False,
         max_length: int = 50000,
         run_manager: Optional[CallbackManagerForToolRun] = None,
-    ) -> str:
+    ) -> Union[str, ThordataToolError]:
         """Scrape the webpage and return HTML."""
+        key = self._cache_key(url=url, js_render=js_render, max_length=max_length)
+        cached = self._cache_get(key)
+        if cached is not MISSING:
+            return cached
+
         client = self._get_client()
 
         try:
@@ -91,15 +112,39 @@ class ThordataScrapeTool(BaseTool):
                 output_format="html",
             )
 
-            # Convert to string if needed
-            if isinstance(result, bytes):
-                result = result.decode("utf-8", errors="ignore")
+            result = _truncate(result, max_length)
+            self._cache_set(key, result)
+            return result
+
+        except Exception as e:
+            return ThordataToolError.from_exception(url, e)
+
+    async def _arun(
+        self,
+        url: str,
+        js_render: bool = False,
+        max_length: int = 50000,
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+    ) -> Union[str, ThordataToolError]:
+        """Scrape the webpage without blocking the event loop."""
+        key = self._cache_key(url=url, js_render=js_render, max_length=max_length)
+        cached = self._cache_get(key)
+        if cached is not MISSING:
+            return cached
 
-            # Truncate to max_length to control token usage
-            if len(result) > max_length:
-                result = result[:max_length] + "\n\n[Content truncated...]"
+        client = get_async_client()
+
+        try:
+            async with get_semaphore(self.concurrency_limit):
+                result = await client.universal_scrape(
+                    url=url,
+                    js_render=js_render,
+                    output_format="html",
+                )
 
+            result = _truncate(result, max_length)
+            self._cache_set(key, result)
             return result
 
         except Exception as e:
-            return f"Error scraping {url}: {str(e)}"
+            return ThordataToolError.from_exception(url, e)
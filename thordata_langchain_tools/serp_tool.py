@@ -6,25 +6,38 @@ Searches Google, Bing, Yandex, DuckDuckGo, and more via Thordata.
 
 from __future__ import annotations
 
-import os
-from typing import Any, Dict, Optional, Type
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Type
 
-from langchain_core.tools import BaseTool
-from langchain_core.callbacks import CallbackManagerForToolRun
-from pydantic import BaseModel, Field
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForToolRun,
+    CallbackManagerForToolRun,
+)
+from pydantic import BaseModel, ConfigDict, Field
 
-from thordata import ThordataClient
+from thordata import ThordataRateLimitError
+
+from ._base import ThordataBaseTool
+from ._cache import MISSING
+from ._client import get_async_client, get_semaphore
+from ._json import _dumps, _loads
+from ._ratelimit import BACKOFF
 
 
 class SerpSearchInput(BaseModel):
     """Input schema for SERP search."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
+
     query: str = Field(description="The search query/keywords to search for.")
     engine: str = Field(
         default="google",
         description="Search engine: google, bing, yandex, duckduckgo, baidu.",
     )
-    num: int = Field(default=10, description="Number of results to return (1-100).")
+    num: int = Field(
+        default=10, ge=1, le=100, description="Number of results to return (1-100)."
+    )
     country: Optional[str] = Field(
         default=None,
         description="Country code for localized results (e.g., 'us', 'gb').",
@@ -37,7 +50,25 @@ class SerpSearchInput(BaseModel):
     )
 
 
-class ThordataSerpTool(BaseTool):
+def _search_failed(error: Exception, query: str, engine: str) -> Dict[str, Any]:
+    """
+    Describe a failed search, backing off first if it was rate-limited.
+
+    ``error_type`` carries the exception class name (for example
+    ``ThordataRateLimitError``) so callers can tell retryable failures
+    apart without parsing the message.
+    """
+    if isinstance(error, ThordataRateLimitError):
+        BACKOFF.penalize(error.retry_after)
+    return {
+        "error": str(error),
+        "error_type": type(error).__name__,
+        "query": query,
+        "engine": engine,
+    }
+
+
+class ThordataSerpTool(ThordataBaseTool):
     """
     LangChain tool for searching the web via Thordata SERP API.
 
@@ -64,25 +95,37 @@ class ThordataSerpTool(BaseTool):
     )
     args_schema: Type[BaseModel] = SerpSearchInput
 
-    # Client instance (initialized lazily)
-    _client: Optional[ThordataClient] = None
-
-    def _get_client(self) -> ThordataClient:
-        """Get or create the Thordata client."""
-        if self._client is None:
-            scraper_token = os.getenv("THORDATA_SCRAPER_TOKEN")
-            if not scraper_token:
-                raise ValueError(
-                    "THORDATA_SCRAPER_TOKEN environment variable is required. "
-                    "Get your token from the Thordata Dashboard."
-                )
-
-            self._client = ThordataClient(
-                scraper_token=scraper_token,
-                public_token=os.getenv("THORDATA_PUBLIC_TOKEN", ""),
-                public_key=os.getenv("THORDATA_PUBLIC_KEY", ""),
-            )
-        return self._client
+    def _search_key(self, search: Dict[str, Any]) -> Optional[bytes]:
+        """Cache key for a search, or ``None`` when caching is disabled."""
+        # Searches differing only in case or spacing share one entry
+        return self._cache_key(
+            **{
+                **search,
+                "query": " ".join(search["query"].split()).lower(),
+                "engine": search["engine"].lower(),
+            }
+        )
+
+    def _lookup(self, key: Optional[bytes]) -> Any:
+        """Return a fresh copy of the cached results for ``key``, or ``MISSING``."""
+        cached = self._cache_get(key)
+        return cached if cached is MISSING else _loads(cached)
+
+    def _store(self, key: Optional[bytes], results: Dict[str, Any]) -> None:
+        """
+        Cache ``results`` as JSON text, so callers mutating their result
+        cannot change what later hits see.
+
+        Results JSON cannot encode (such as integers wider than 64 bits
+        under orjson) are returned uncached rather than failing the search.
+        """
+        if key is None:
+            return
+        try:
+            payload = _dumps(results)
+        except (TypeError, ValueError):
+            return
+        self._cache_set(key, payload)
 
     def _run(
         self,
@@ -95,21 +138,86 @@ class ThordataSerpTool(BaseTool):
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> Dict[str, Any]:
         """Execute the SERP search."""
+        search = dict(
+            query=query,
+            engine=engine,
+            num=num,
+            country=country,
+            language=language,
+            search_type=search_type,
+        )
+        key = self._search_key(search)
+        cached = self._lookup(key)
+        if cached is not MISSING:
+            return cached
+
         client = self._get_client()
+        BACKOFF.wait()
 
         try:
-            results = client.serp_search(
-                query=query,
-                engine=engine,
-                num=num,
-                country=country,
-                language=language,
-                search_type=search_type,
-            )
-            return results
+            results = client.serp_search(**search)
         except Exception as e:
-            return {
-                "error": str(e),
-                "query": query,
-                "engine": engine,
-            }
+            return _search_failed(e, query, engine)
+
+        self._store(key, results)
+        return results
+
+    async def _arun(
+        self,
+        query: str,
+        engine: str = "google",
+        num: int = 10,
+        country: Optional[str] = None,
+        language: Optional[str] = None,
+        search_type: Optional[str] = None,
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+    ) -> Dict[str, Any]:
+        """Execute the SERP search without blocking the event loop."""
+        search = dict(
+            query=query,
+            engine=engine,
+            num=num,
+            country=country,
+            language=language,
+            search_type=search_type,
+        )
+        key = self._search_key(search)
+        cached = self._lookup(key)
+        if cached is not MISSING:
+            return cached
+
+        client = get_async_client()
+        await BACKOFF.await_ready()
+
+        try:
+            async with get_semaphore(self.concurrency_limit):
+                results = await client.serp_search(**search)
+        except Exception as e:
+            return _search_failed(e, query, engine)
+
+        self._store(key, results)
+        return results
+
+    def batch_run(
+        self, inputs: List[SerpSearchInput], max_workers: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Run several searches concurrently, returning results in input order.
+
+        Worker threads share the pooled Thordata client, so the searches
+        reuse keep-alive connections.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda i: self._run(**i.model_dump()), inputs))
+
+    async def abatch_run(
+        self, inputs: List[SerpSearchInput], max_workers: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Async variant of :meth:`batch_run`."""
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def run_one(search: SerpSearchInput) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._arun(**search.model_dump())
+
+        return list(await asyncio.gather(*(run_one(i) for i in inputs)))
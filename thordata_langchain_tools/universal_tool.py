@@ -6,19 +6,27 @@ More advanced scraping with JS rendering, screenshots, and geo-targeting.
 
 from __future__ import annotations
 
-import os
 from typing import Optional, Type, Union
 
-from langchain_core.tools import BaseTool
-from langchain_core.callbacks import CallbackManagerForToolRun
-from pydantic import BaseModel, Field
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForToolRun,
+    CallbackManagerForToolRun,
+)
+from pydantic import BaseModel, ConfigDict, Field
 
-from thordata import ThordataClient
+
+from ._base import ThordataBaseTool
+from ._cache import MISSING
+from ._client import get_async_client, get_semaphore
+from .errors import ThordataToolError
+from .scrape_tool import _MAX_UTF8_BYTES
 
 
 class UniversalScrapeInput(BaseModel):
     """Input schema for universal scraping."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
+
     url: str = Field(description="The URL to scrape.")
     js_render: bool = Field(
         default=True,
@@ -35,9 +43,44 @@ class UniversalScrapeInput(BaseModel):
     wait_for: Optional[str] = Field(
         default=None, description="CSS selector to wait for before returning content."
     )
+    max_bytes: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Truncate HTML output to at most this many UTF-8 bytes.",
+    )
+
+
+# Output formats whose payload is text rather than binary image data.
+_TEXT_FORMATS = frozenset({"html"})
+
+
+def _decode_html(
+    result: Union[str, bytes], output_format: str, max_bytes: Optional[int] = None
+) -> Union[str, bytes]:
+    """
+    For HTML output, ensure the scraped content is a string.
+
+    ``str`` results are returned untouched unless they may exceed
+    ``max_bytes``. Buffer results are sliced through a ``memoryview`` and
+    decoded with ``str(buffer, ...)``, so only the kept prefix is ever
+    copied; callers rebind their reference so the raw payload is freed
+    right away. A character split by the cut is dropped. Screenshots are
+    never truncated, since a partial PNG is not a usable image.
+    """
+    if output_format.lower() not in _TEXT_FORMATS:
+        return result
+    if isinstance(result, str):
+        if max_bytes is None or len(result) * _MAX_UTF8_BYTES <= max_bytes:
+            return result
+        return str(result.encode("utf-8")[:max_bytes], "utf-8", "ignore")
+    if isinstance(result, (bytes, bytearray, memoryview)):
+        if max_bytes is not None:
+            result = memoryview(result)[:max_bytes]
+        return str(result, "utf-8", "ignore")
+    return result
 
 
-class ThordataUniversalTool(BaseTool):
+class ThordataUniversalTool(ThordataBaseTool):
     """
     LangChain tool for advanced web scraping via Thordata Universal API.
 
@@ -65,23 +108,19 @@ class ThordataUniversalTool(BaseTool):
     )
     args_schema: Type[BaseModel] = UniversalScrapeInput
 
-    _client: Optional[ThordataClient] = None
-
-    def _get_client(self) -> ThordataClient:
-        """Get or create the Thordata client."""
-        if self._client is None:
-            scraper_token = os.getenv("THORDATA_SCRAPER_TOKEN")
-            if not scraper_token:
-                raise ValueError(
-                    "THORDATA_SCRAPER_TOKEN environment variable is required."
-                )
-
-            self._client = ThordataClient(
-                scraper_token=scraper_token,
-                public_token=os.getenv("THORDATA_PUBLIC_TOKEN", ""),
-                public_key=os.getenv("THORDATA_PUBLIC_KEY", ""),
-            )
-        return self._client
+    def _finish(
+        self,
+        key: Optional[bytes],
+        result: Union[str, bytes],
+        output_format: str,
+        max_bytes: Optional[int],
+    ) -> Union[str, bytes]:
+        """Decode a fetched result and cache it if it is text."""
+        result = _decode_html(result, output_format, max_bytes)
+        # Screenshots can be several MB each, so only text is cached
+        if output_format.lower() in _TEXT_FORMATS:
+            self._cache_set(key, result)
+        return result
 
     def _run(
         self,
@@ -90,25 +129,60 @@ class ThordataUniversalTool(BaseTool):
         output_format: str = "html",
         country: Optional[str] = None,
         wait_for: Optional[str] = None,
+        max_bytes: Optional[int] = None,
         run_manager: Optional[CallbackManagerForToolRun] = None,
-    ) -> Union[str, bytes]:
+    ) -> Union[str, bytes, ThordataToolError]:
         """Execute universal scraping."""
+        request = dict(
+            url=url,
+            js_render=js_render,
+            output_format=output_format,
+            country=country,
+            wait_for=wait_for,
+        )
+        key = self._cache_key(max_bytes=max_bytes, **request)
+        cached = self._cache_get(key)
+        if cached is not MISSING:
+            return cached
+
         client = self._get_client()
 
         try:
-            result = client.universal_scrape(
-                url=url,
-                js_render=js_render,
-                output_format=output_format,
-                country=country,
-                wait_for=wait_for,
-            )
-
-            # For HTML output, ensure it's a string
-            if output_format.lower() == "html" and isinstance(result, bytes):
-                return result.decode("utf-8", errors="ignore")
+            result = client.universal_scrape(**request)
+        except Exception as e:
+            return ThordataToolError.from_exception(url, e)
 
-            return result
+        return self._finish(key, result, output_format, max_bytes)
+
+    async def _arun(
+        self,
+        url: str,
+        js_render: bool = True,
+        output_format: str = "html",
+        country: Optional[str] = None,
+        wait_for: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+    ) -> Union[str, bytes, ThordataToolError]:
+        """Execute universal scraping without blocking the event loop."""
+        request = dict(
+            url=url,
+            js_render=js_render,
+            output_format=output_format,
+            country=country,
+            wait_for=wait_for,
+        )
+        key = self._cache_key(max_bytes=max_bytes, **request)
+        cached = self._cache_get(key)
+        if cached is not MISSING:
+            return cached
+
+        client = get_async_client()
 
+        try:
+            async with get_semaphore(self.concurrency_limit):
+                result = await client.universal_scrape(**request)
         except Exception as e:
-            return f"Error scraping {url}: {str(e)}"
+            return ThordataToolError.from_exception(url, e)
+
+        return self._finish(key, result, output_format, max_bytes)